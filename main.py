@@ -19,13 +19,9 @@ Author: Your Name
 GitHub: https://github.com/formertriton
 """
 
-import sys
-import os
+import asyncio
 
-# Add src directory to Python path
-sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
-
-from game import SnakeGame
+from src.game import SnakeGame
 
 def main():
     """Main entry point for the Snake game."""
@@ -37,7 +33,7 @@ def main():
         
         # Create and run the game
         game = SnakeGame()
-        game.run()
+        asyncio.run(game.run())
         
     except KeyboardInterrupt:
         print("\nGame interrupted by user.")
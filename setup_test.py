@@ -13,17 +13,18 @@ Run this before playing the game to ensure everything works!
 import sys
 import os
 import json
+from collections import defaultdict
 from importlib import import_module
 
 def test_python_version():
     """Test if Python version is compatible."""
     print("🐍 Testing Python version...")
     version = sys.version_info
-    if version.major >= 3 and version.minor >= 8:
+    if version.major >= 3 and version.minor >= 9:
         print(f"   ✅ Python {version.major}.{version.minor}.{version.micro} - Compatible!")
         return True
     else:
-        print(f"   ❌ Python {version.major}.{version.minor}.{version.micro} - Needs Python 3.8+")
+        print(f"   ❌ Python {version.major}.{version.minor}.{version.micro} - Needs Python 3.9+")
         return False
 
 def test_dependencies():
@@ -41,7 +42,8 @@ def test_dependencies():
     
     for package, description in dependencies:
         try:
-            import_module(package)
+            # Reuse modules that are already loaded instead of re-resolving them
+            sys.modules.get(package) or import_module(package)
             print(f"   ✅ {package} - {description}")
         except ImportError:
             print(f"   ❌ {package} - {description} (MISSING)")
@@ -65,10 +67,24 @@ def test_project_structure():
         'src/data_visualizer.py'
     ]
     
+    # List each directory once instead of stat-ing every file
+    by_dir = defaultdict(set)
+    for file_path in required_files:
+        directory, name = os.path.split(file_path)
+        by_dir[directory or '.'].add(name)
+    
+    present = set()
+    for directory, names in by_dir.items():
+        if os.path.isdir(directory):
+            with os.scandir(directory) as entries:
+                found = {entry.name for entry in entries if entry.is_file()}
+            present.update(os.path.normpath(os.path.join(directory, name))
+                           for name in names & found)
+    
     all_good = True
     
     for file_path in required_files:
-        if os.path.exists(file_path):
+        if os.path.normpath(file_path) in present:
             print(f"   ✅ {file_path}")
         else:
             print(f"   ❌ {file_path} (MISSING)")
@@ -104,14 +120,11 @@ def test_game_import():
     print("\n🎮 Testing game modules...")
     
     try:
-        # Add src to path
-        sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
-        
-        from game import SnakeGame
-        from snake import Snake
-        from food import Food
-        from game_stats import GameStats
-        from data_visualizer import GameDataVisualizer
+        from src.game import SnakeGame
+        from src.snake import Snake
+        from src.food import Food
+        from src.game_stats import GameStats
+        from src.data_visualizer import GameDataVisualizer
         
         print("   ✅ All game modules imported successfully!")
         return True
@@ -1,10 +1,142 @@
-import matplotlib.pyplot as plt
-import pandas as pd
 import json
 import os
+import sys
 from datetime import datetime
-from typing import List, Dict, Any
-import numpy as np
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
+
+# pandas, numpy and matplotlib are imported where they are used, so
+# importing this module (e.g. for the progress report) stays cheap
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Columns written by GameStats for every game, with their storage dtypes
+GAME_COLUMNS = ('start_time', 'end_time', 'score', 'max_length', 'duration_seconds',
+                'total_moves', 'direction_changes', 'foods_eaten')
+GAME_DTYPES = {
+    'score': 'int32',
+    'max_length': 'int32',
+    'duration_seconds': 'float64',
+    'total_moves': 'int32',
+    'direction_changes': 'int32',
+    'foods_eaten': 'int32'
+}
+HIGH_SCORE_COLUMNS = ('score', 'max_length', 'duration_seconds', 'foods_eaten',
+                      'date', 'efficiency')
+
+def _file_version(path: str) -> Optional[Tuple[int, int]]:
+    """Return (mtime_ns, size) of a file, or None if it does not exist."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+def _read_json_records(path: str) -> List[Dict[str, Any]]:
+    """
+    Read a JSON list of records, returning an empty list on failure.
+    
+    Args:
+        path (str): Path to JSON file
+        
+    Returns:
+        List[Dict[str, Any]]: Parsed records
+    """
+    if os.path.exists(path):
+        try:
+            with open(path, 'rb') as f:
+                return _json_loads(f.read())
+        except (ValueError, IOError):
+            pass
+    return []
+
+def _history_file(stats_file: str) -> str:
+    """
+    Return the file game history is read from, as GameStats does.
+    
+    A missing stats file falls back to a legacy game_stats.json beside it.
+    """
+    if not os.path.exists(stats_file):
+        legacy_file = os.path.splitext(stats_file)[0] + '.json'
+        if os.path.exists(legacy_file):
+            return legacy_file
+    return stats_file
+
+def _read_jsonl_records(path: str) -> List[Dict[str, Any]]:
+    """
+    Read a JSON Lines file, skipping lines that fail to parse.
+    
+    A legacy file holding one JSON list of records is read as such.
+    
+    Args:
+        path (str): Path to JSON Lines file
+        
+    Returns:
+        List[Dict[str, Any]]: Parsed records
+    """
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+    except IOError:
+        return []
+    
+    if data.lstrip()[:1] == b'[':
+        try:
+            return _json_loads(data)
+        except ValueError:
+            return []
+    
+    records = []
+    for line in data.splitlines():
+        if line.strip():
+            try:
+                records.append(_json_loads(line))
+            except ValueError:
+                pass
+    return records
+
+@lru_cache(maxsize=4)
+def _load_game_df(stats_file: str, stats_version: Optional[Tuple[int, int]]):
+    """
+    Build the game history DataFrame from a stats file.
+    
+    The version argument is only part of the cache key: when the file is
+    rewritten its version changes and the frame is rebuilt.
+    """
+    import pandas as pd
+    
+    game_history = _read_jsonl_records(stats_file)
+    if not game_history:
+        return pd.DataFrame()
+    
+    # Fixed schema instead of inferring it; a column with gaps (records
+    # missing the field) stays float64 with NaN, as pandas would infer
+    game_df = pd.DataFrame.from_records(game_history, columns=GAME_COLUMNS)
+    dtypes = {column: dtype if game_df[column].notna().all() else 'float64'
+              for column, dtype in GAME_DTYPES.items()}
+    game_df = game_df.astype(dtypes, copy=False)
+    
+    game_df['start_time'] = pd.to_datetime(game_df['start_time'],
+                                           format='ISO8601', cache=True)
+    game_df['date'] = game_df['start_time'].dt.date
+    return game_df
+
+@lru_cache(maxsize=4)
+def _load_scores_df(high_scores_file: str, high_scores_version: Optional[Tuple[int, int]]):
+    """Build the high scores DataFrame, cached like _load_game_df."""
+    import pandas as pd
+    
+    high_scores = _read_json_records(high_scores_file)
+    if not high_scores:
+        return pd.DataFrame()
+    
+    scores_df = pd.DataFrame.from_records(high_scores, columns=HIGH_SCORE_COLUMNS)
+    scores_df['date'] = pd.to_datetime(scores_df['date'], format='ISO8601', cache=True)
+    return scores_df
 
 class GameDataVisualizer:
     """
@@ -14,110 +146,123 @@ class GameDataVisualizer:
     gameplay patterns, performance trends, and statistics.
     """
     
-    def __init__(self, stats_file: str = "data/game_stats.json",
+    def __init__(self, stats_file: str = "data/game_stats.jsonl",
                  high_scores_file: str = "data/high_scores.json"):
         """
         Initialize the data visualizer.
         
         Args:
-            stats_file (str): Path to game statistics file
+            stats_file (str): Path to game statistics file (JSON Lines)
             high_scores_file (str): Path to high scores file
         """
         self.stats_file = stats_file
         self.high_scores_file = high_scores_file
+    
+    def load_game_df(self):
+        """
+        Load the game history as a DataFrame.
         
-        # Set matplotlib style
-        plt.style.use('dark_background')
-        plt.rcParams['figure.figsize'] = (12, 8)
-        plt.rcParams['font.size'] = 10
+        Results are memoized per file modification time, so the progress
+        report and the dashboard share one parse until a new game is saved.
+        The returned DataFrame is shared and must be treated as read-only.
+        
+        Returns:
+            pd.DataFrame: One row per recorded game
+        """
+        history_file = _history_file(self.stats_file)
+        return _load_game_df(history_file, _file_version(history_file))
+    
+    def load_scores_df(self):
+        """
+        Load the high scores as a DataFrame, memoized like load_game_df.
+        
+        Returns:
+            pd.DataFrame: One row per high score entry
+        """
+        return _load_scores_df(self.high_scores_file, _file_version(self.high_scores_file))
     
     def load_data(self) -> tuple:
         """
         Load game data from JSON files.
         
+        Kept for callers that want both frames; the dashboard and report
+        only need load_game_df().
+        
         Returns:
             tuple: (game_history_df, high_scores_df)
         """
-        game_history = []
-        high_scores = []
-        
-        # Load game history
-        if os.path.exists(self.stats_file):
-            try:
-                with open(self.stats_file, 'r') as f:
-                    game_history = json.load(f)
-            except (json.JSONDecodeError, IOError):
-                pass
-        
-        # Load high scores
-        if os.path.exists(self.high_scores_file):
-            try:
-                with open(self.high_scores_file, 'r') as f:
-                    high_scores = json.load(f)
-            except (json.JSONDecodeError, IOError):
-                pass
-        
-        # Convert to DataFrames
-        game_df = pd.DataFrame(game_history) if game_history else pd.DataFrame()
-        scores_df = pd.DataFrame(high_scores) if high_scores else pd.DataFrame()
-        
-        # Process datetime columns
-        if not game_df.empty and 'start_time' in game_df.columns:
-            game_df['start_time'] = pd.to_datetime(game_df['start_time'])
-            game_df['date'] = game_df['start_time'].dt.date
-        
-        if not scores_df.empty and 'date' in scores_df.columns:
-            scores_df['date'] = pd.to_datetime(scores_df['date'])
-        
-        return game_df, scores_df
+        return self.load_game_df(), self.load_scores_df()
     
-    def create_performance_dashboard(self, output_file: str = "performance_dashboard.png") -> None:
+    def create_performance_dashboard(self, output_file: str = "performance_dashboard.png",
+                                     dpi: int = 150) -> None:
         """
         Create a comprehensive performance dashboard.
         
         Args:
             output_file (str): Output filename for the dashboard
+            dpi (int): Resolution of the saved image
         """
-        game_df, scores_df = self.load_data()
+        game_df = self.load_game_df()
         
         if game_df.empty:
             print("No game data available for visualization.")
             return
         
+        import numpy as np
+        import matplotlib
+        import matplotlib.pyplot as plt
+        
+        # Set matplotlib style
+        plt.style.use('dark_background')
+        plt.rcParams['figure.figsize'] = (12, 8)
+        plt.rcParams['font.size'] = 10
+        
+        # Pull the plotted columns out of pandas once
+        cols = set(game_df.columns)
+        scores = game_df['score'].to_numpy(dtype=np.float64, copy=False)
+        durations = game_df['duration_seconds'].to_numpy(dtype=np.float64, copy=False)
+        foods = game_df['foods_eaten'].to_numpy(dtype=np.float64, copy=False)
+        n = scores.size
+        xs = np.arange(n, dtype=np.float64)
+        score_mean = np.nanmean(scores)
+        
         # Create figure with subplots
         fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 12))
         fig.suptitle('🐍 Snake Game Performance Dashboard', fontsize=20, y=0.98)
         
         # 1. Score progression over time
-        if len(game_df) > 1:
-            ax1.plot(range(len(game_df)), game_df['score'], 
+        if n > 1:
+            ax1.plot(xs, scores, 
                     color='#00FF00', marker='o', markersize=3, linewidth=2)
             ax1.set_title('Score Progression Over Games', fontsize=14, pad=15)
             ax1.set_xlabel('Game Number')
             ax1.set_ylabel('Score')
             ax1.grid(True, alpha=0.3)
             
-            # Add trend line
-            z = np.polyfit(range(len(game_df)), game_df['score'], 1)
-            p = np.poly1d(z)
-            ax1.plot(range(len(game_df)), p(range(len(game_df))), 
+            # Add trend line (closed-form least squares fit over known scores)
+            known = ~np.isnan(scores)
+            x_mean = xs[known].mean()
+            dx = xs[known] - x_mean
+            slope = (dx * (scores[known] - score_mean)).sum() / (dx * dx).sum()
+            intercept = score_mean - slope * x_mean
+            ax1.plot(xs, slope * xs + intercept, 
                     "--", alpha=0.8, color='#FFFF00', linewidth=2)
         
         # 2. Score distribution histogram
-        if len(game_df) > 0:
-            ax2.hist(game_df['score'], bins=min(20, len(game_df)), 
+        if n > 0:
+            ax2.hist(scores, bins=min(20, n), 
                     color='#00FF00', alpha=0.7, edgecolor='white')
             ax2.set_title('Score Distribution', fontsize=14, pad=15)
             ax2.set_xlabel('Score')
             ax2.set_ylabel('Frequency')
-            ax2.axvline(game_df['score'].mean(), color='#FFFF00', 
-                       linestyle='--', linewidth=2, label=f'Mean: {game_df["score"].mean():.1f}')
+            ax2.axvline(score_mean, color='#FFFF00', 
+                       linestyle='--', linewidth=2, label=f'Mean: {score_mean:.1f}')
             ax2.legend()
         
         # 3. Game duration vs Score scatter plot
-        if 'duration_seconds' in game_df.columns and len(game_df) > 0:
-            scatter = ax3.scatter(game_df['duration_seconds'], game_df['score'], 
-                                c=game_df['foods_eaten'], cmap='viridis', 
+        if 'duration_seconds' in cols and n > 0:
+            scatter = ax3.scatter(durations, scores, 
+                                c=foods, cmap='viridis', 
                                 s=60, alpha=0.7, edgecolors='white')
             ax3.set_title('Game Duration vs Score', fontsize=14, pad=15)
             ax3.set_xlabel('Duration (seconds)')
@@ -129,18 +274,26 @@ class GameDataVisualizer:
             cbar.set_label('Foods Eaten')
         
         # 4. Performance metrics
-        if len(game_df) > 0:
+        if n > 0:
             metrics = ['max_length', 'foods_eaten', 'direction_changes', 'total_moves']
-            available_metrics = [m for m in metrics if m in game_df.columns]
+            available_metrics = [m for m in metrics if m in cols]
             
             if available_metrics:
-                # Calculate correlation matrix
-                corr_data = game_df[['score'] + available_metrics].corr()['score'][1:]
+                # Correlate score with each metric only (one row of the matrix);
+                # with gaps, let pandas drop missing values pair by pair
+                centered = game_df[['score', *available_metrics]].to_numpy(dtype=np.float64).T
+                if np.isnan(centered).any():
+                    corr_data = game_df[['score', *available_metrics]].corr()['score'].to_numpy()[1:]
+                else:
+                    centered -= centered.mean(axis=1, keepdims=True)
+                    norms = np.linalg.norm(centered, axis=1)
+                    with np.errstate(divide='ignore', invalid='ignore'):
+                        corr_data = (centered[1:] @ centered[0]) / (norms[1:] * norms[0])
                 
-                colors = ['#FF6B6B' if x < 0 else '#4ECDC4' for x in corr_data.values]
-                bars = ax4.barh(range(len(corr_data)), corr_data.values, color=colors, alpha=0.8)
+                colors = ['#FF6B6B' if x < 0 else '#4ECDC4' for x in corr_data]
+                bars = ax4.barh(range(len(corr_data)), corr_data, color=colors, alpha=0.8)
                 ax4.set_yticks(range(len(corr_data)))
-                ax4.set_yticklabels([m.replace('_', ' ').title() for m in corr_data.index])
+                ax4.set_yticklabels([m.replace('_', ' ').title() for m in available_metrics])
                 ax4.set_title('Score Correlation with Game Metrics', fontsize=14, pad=15)
                 ax4.set_xlabel('Correlation with Score')
                 ax4.grid(True, alpha=0.3, axis='x')
@@ -157,12 +310,17 @@ class GameDataVisualizer:
         plt.subplots_adjust(top=0.94)
         
         # Save the plot
-        plt.savefig(output_file, dpi=300, bbox_inches='tight', 
-                   facecolor='black', edgecolor='none')
+        plt.savefig(output_file, dpi=dpi, bbox_inches='tight', 
+                   facecolor='black', edgecolor='none',
+                   metadata={'Software': 'snake'},
+                   pil_kwargs={'optimize': True, 'compress_level': 6})
         print(f"Performance dashboard saved as {output_file}")
         
-        # Also show the plot
-        plt.show()
+        # Also show the plot, unless there is no GUI to show it on
+        if matplotlib.get_backend().lower() != 'agg':
+            plt.show()
+        else:
+            plt.close(fig)
     
     def create_progress_report(self) -> Dict[str, Any]:
         """
@@ -171,53 +329,59 @@ class GameDataVisualizer:
         Returns:
             Dict[str, Any]: Progress report data
         """
-        game_df, scores_df = self.load_data()
+        game_df = self.load_game_df()
         
         if game_df.empty:
             return {"error": "No game data available"}
         
+        import numpy as np
+        
         # Calculate various statistics
         total_games = len(game_df)
         total_playtime = game_df['duration_seconds'].sum() if 'duration_seconds' in game_df.columns else 0
+        stats = game_df['score'].agg(['mean', 'std', 'max', 'min', 'count'])
+        
+        # Recent performance (last 10 games), on zero-copy views of the scores
+        scores = game_df['score'].to_numpy(dtype=np.float64)
+        has_recent = scores.size > 10
+        recent_mean = np.nanmean(scores[-10:]) if has_recent else 0.0
+        earlier_mean = np.nanmean(scores[:-10]) if has_recent else 0.0
+        
+        # Round every reported float in one call
+        (average_score, score_std, playtime_hours,
+         recent_avg, earlier_avg, improvement) = np.round([
+            stats['mean'], stats['std'], total_playtime / 3600,
+            recent_mean, earlier_mean, recent_mean - earlier_mean
+        ], 2).tolist()
         
         report = {
             "summary": {
                 "total_games": total_games,
-                "total_playtime_hours": round(total_playtime / 3600, 2),
-                "average_score": round(game_df['score'].mean(), 2),
-                "best_score": int(game_df['score'].max()),
-                "worst_score": int(game_df['score'].min()),
-                "score_std": round(game_df['score'].std(), 2)
+                "total_playtime_hours": playtime_hours,
+                "average_score": average_score,
+                "best_score": int(stats['max']),
+                "worst_score": int(stats['min']),
+                "score_std": score_std
             },
             "recent_performance": {},
             "achievements": []
         }
         
-        # Recent performance (last 10 games)
-        if len(game_df) >= 10:
-            recent_games = game_df.tail(10)
-            earlier_games = game_df.iloc[:-10] if len(game_df) > 10 else game_df.head(0)
-            
-            if not earlier_games.empty:
-                report["recent_performance"] = {
-                    "recent_avg_score": round(recent_games['score'].mean(), 2),
-                    "earlier_avg_score": round(earlier_games['score'].mean(), 2),
-                    "improvement": round(recent_games['score'].mean() - earlier_games['score'].mean(), 2)
-                }
-        
-        # Achievements
-        if total_games >= 10:
-            report["achievements"].append("🎮 Dedicated Player - Played 10+ games")
-        if game_df['score'].max() >= 100:
-            report["achievements"].append("💯 Century Club - Scored 100+ points")
-        if total_playtime >= 3600:  # 1 hour
-            report["achievements"].append("⏰ Time Master - 1+ hour of playtime")
-        
-        # Consistency check
-        if len(game_df) >= 5:
-            cv = game_df['score'].std() / game_df['score'].mean()
-            if cv < 0.5:
-                report["achievements"].append("📊 Consistent Player - Low score variation")
+        if has_recent:
+            report["recent_performance"] = {
+                "recent_avg_score": recent_avg,
+                "earlier_avg_score": earlier_avg,
+                "improvement": improvement
+            }
+        
+        # Achievements, decided from the summary statistics computed above
+        cv = stats['std'] / stats['mean'] if stats['mean'] else float('inf')
+        report["achievements"] = [label for earned, label in [
+            (total_games >= 10, "🎮 Dedicated Player - Played 10+ games"),
+            (stats['max'] >= 100, "💯 Century Club - Scored 100+ points"),
+            (total_playtime >= 3600, "⏰ Time Master - 1+ hour of playtime"),
+            (total_games >= 5 and cv < 0.5, "📊 Consistent Player - Low score variation")
+        ] if earned]
         
         return report
     
@@ -226,50 +390,78 @@ class GameDataVisualizer:
         report = self.create_progress_report()
         
         if "error" in report:
-            print(f"❌ {report['error']}")
+            self._write_console([f"❌ {report['error']}"])
             return
         
-        print("\n" + "="*60)
-        print("🐍 SNAKE GAME PROGRESS REPORT 🐍")
-        print("="*60)
+        lines = [
+            "\n" + "="*60,
+            "🐍 SNAKE GAME PROGRESS REPORT 🐍",
+            "="*60
+        ]
         
         # Summary
         summary = report["summary"]
-        print(f"\n📊 GAME SUMMARY:")
-        print(f"   Total Games Played: {summary['total_games']}")
-        print(f"   Total Playtime: {summary['total_playtime_hours']} hours")
-        print(f"   Average Score: {summary['average_score']}")
-        print(f"   Best Score: {summary['best_score']}")
-        print(f"   Score Range: {summary['worst_score']} - {summary['best_score']}")
-        print(f"   Score Consistency (σ): {summary['score_std']}")
+        lines += [
+            "\n📊 GAME SUMMARY:",
+            f"   Total Games Played: {summary['total_games']}",
+            f"   Total Playtime: {summary['total_playtime_hours']} hours",
+            f"   Average Score: {summary['average_score']}",
+            f"   Best Score: {summary['best_score']}",
+            f"   Score Range: {summary['worst_score']} - {summary['best_score']}",
+            f"   Score Consistency (σ): {summary['score_std']}"
+        ]
         
         # Recent performance
         if report["recent_performance"]:
             perf = report["recent_performance"]
-            print(f"\n📈 RECENT PERFORMANCE (Last 10 Games):")
-            print(f"   Recent Average: {perf['recent_avg_score']}")
-            print(f"   Earlier Average: {perf['earlier_avg_score']}")
+            lines += [
+                "\n📈 RECENT PERFORMANCE (Last 10 Games):",
+                f"   Recent Average: {perf['recent_avg_score']}",
+                f"   Earlier Average: {perf['earlier_avg_score']}"
+            ]
             improvement = perf['improvement']
             if improvement > 0:
-                print(f"   Improvement: +{improvement} points 📈")
+                lines.append(f"   Improvement: +{improvement} points 📈")
             elif improvement < 0:
-                print(f"   Change: {improvement} points 📉")
+                lines.append(f"   Change: {improvement} points 📉")
             else:
-                print(f"   Change: No change ➡️")
+                lines.append("   Change: No change ➡️")
         
         # Achievements
         if report["achievements"]:
-            print(f"\n🏆 ACHIEVEMENTS:")
-            for achievement in report["achievements"]:
-                print(f"   {achievement}")
+            lines.append("\n🏆 ACHIEVEMENTS:")
+            lines += [f"   {achievement}" for achievement in report["achievements"]]
+        
+        lines.append("\n" + "="*60)
+        self._write_console(lines)
+    
+    @staticmethod
+    def _write_console(lines: List[str]) -> None:
+        """
+        Write report lines to stdout in a single call.
+        
+        Consoles without a UTF encoding get emoji replaced instead of
+        raising UnicodeEncodeError.
         
-        print("\n" + "="*60)
+        Args:
+            lines (List[str]): Lines to print
+        """
+        text = "\n".join(lines) + "\n"
+        encoding = sys.stdout.encoding or ""
+        if not encoding.lower().startswith("utf"):
+            text = text.encode(encoding or "ascii", "replace").decode(encoding or "ascii")
+        sys.stdout.write(text)
 
 def main():
     """Main function to demonstrate data visualization."""
     print("Snake Game Data Visualizer")
     print("=" * 40)
     
+    # Render off-screen when nobody is watching
+    if not sys.stdout.isatty() or os.environ.get('SNAKE_HEADLESS'):
+        import matplotlib
+        matplotlib.use('Agg')
+    
     visualizer = GameDataVisualizer()
     
     # Print progress report
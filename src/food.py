@@ -1,6 +1,7 @@
 import pygame
-import random
-from typing import Tuple, List
+import numpy as np
+from types import SimpleNamespace
+from typing import Optional, Tuple
 
 class Food:
     """
@@ -10,7 +11,8 @@ class Food:
     and rendering. It ensures food doesn't spawn on the snake's body.
     """
     
-    def __init__(self, cell_size: int, grid_width: int, grid_height: int):
+    def __init__(self, cell_size: int, grid_width: int, grid_height: int,
+                 colors: SimpleNamespace, occupancy: Optional[bytearray] = None):
         """
         Initialize food object.
         
@@ -18,52 +20,104 @@ class Food:
             cell_size (int): Size of each cell in pixels
             grid_width (int): Width of game grid in cells
             grid_height (int): Height of game grid in cells
+            colors (SimpleNamespace): Parsed colors used for the food sprite
+            occupancy (Optional[bytearray]): The snake's flat occupancy grid
+                (index y * grid_width + x, 1 where the snake is), read
+                whenever food spawns
         """
         self.cell_size = cell_size
         self.grid_width = grid_width
         self.grid_height = grid_height
         self.position = (0, 0)
+        self._pos_idx = 0  # position as flat index y * grid_width + x
         self.foods_eaten = 0
         
+        # Drawing geometry only depends on cell size
+        self._radius = cell_size // 3
+        self._half_cell = cell_size // 2
+        self._last_rect = None
+        self.set_colors(colors)
+        
+        # Shared with the snake, plus a numpy view of the same bytes for the
+        # dense-grid spawn path
+        if occupancy is None:
+            occupancy = bytearray(grid_width * grid_height)
+        self._occupancy = occupancy
+        self._occ = np.frombuffer(occupancy, dtype=np.uint8)
+        
+        # Candidate cells are drawn from the RNG in batches
+        self._rng = np.random.default_rng()
+        self._refill_candidates()
+        
         # Generate initial food position
-        self.spawn_food([])
+        self.spawn_food(occupancy.count(1))
+    
+    def _refill_candidates(self) -> None:
+        """Draw a fresh batch of random flat cell indices."""
+        self._cand_buf = self._rng.integers(0, self.grid_width * self.grid_height,
+                                            size=128, dtype=np.int32).tolist()
+        self._cand_i = 0
+    
+    def _next_candidate(self) -> int:
+        """Return the next random flat cell index from the candidate batch."""
+        if self._cand_i >= len(self._cand_buf):
+            self._refill_candidates()
+        idx = self._cand_buf[self._cand_i]
+        self._cand_i += 1
+        return idx
+    
+    def _place(self, idx: int) -> None:
+        """Move the food to the cell with the given flat index."""
+        y, x = divmod(idx, self.grid_width)
+        self.position = (x, y)
+        self._pos_idx = idx
     
-    def spawn_food(self, snake_body: List[Tuple[int, int]]) -> None:
+    def spawn_food(self, occupied_count: int) -> bool:
         """
-        Spawn food at random position not occupied by snake.
+        Spawn food at a uniformly random position not occupied by snake.
+        
+        While the grid is mostly empty a few O(1) occupancy lookups find a
+        free cell; once the snake covers half the grid the free cells are
+        taken from the whole occupancy grid instead, so the cost never
+        degrades into endless retries.
         
         Args:
-            snake_body (List[Tuple[int, int]]): Current snake body positions
+            occupied_count (int): Number of cells covered by the snake
+            
+        Returns:
+            bool: True if food was placed, False if the snake fills the grid
         """
-        max_attempts = 100
-        attempts = 0
+        total_cells = self.grid_width * self.grid_height
         
-        while attempts < max_attempts:
-            x = random.randint(0, self.grid_width - 1)
-            y = random.randint(0, self.grid_height - 1)
-            potential_position = (x, y)
-            
-            if potential_position not in snake_body:
-                self.position = potential_position
-                break
-                
-            attempts += 1
+        if occupied_count < 0.5 * total_cells:
+            occupancy = self._occupancy
+            while True:
+                idx = self._next_candidate()
+                if not occupancy[idx]:
+                    self._place(idx)
+                    return True
+        
+        # Dense grid: pick uniformly among the free cells of the grid
+        free_cells = np.flatnonzero(self._occ == 0)
         
-        # Fallback: if we can't find empty space, place at (0,0)
-        if attempts >= max_attempts:
-            self.position = (0, 0)
+        # Grid completely filled: there is nowhere left to put food
+        if not free_cells.size:
+            return False
+        self._place(int(free_cells[self._rng.integers(free_cells.size)]))
+        return True
     
-    def check_collision(self, snake_head: Tuple[int, int]) -> bool:
+    def check_collision(self, snake_head_idx: int) -> bool:
         """
         Check if snake head collided with food.
         
         Args:
-            snake_head (Tuple[int, int]): Position of snake's head
+            snake_head_idx (int): Flat index (y * grid_width + x) of the
+                snake's head, which must be on the grid
             
         Returns:
             bool: True if collision detected
         """
-        if snake_head == self.position:
+        if snake_head_idx == self._pos_idx:
             self.foods_eaten += 1
             return True
         return False
@@ -72,29 +126,39 @@ class Food:
         """Get current food position."""
         return self.position
     
-    def draw(self, surface: pygame.Surface, colors: dict) -> None:
+    def set_colors(self, colors: SimpleNamespace) -> None:
+        """
+        Pre-render the food sprite with the given colors.
+        
+        Args:
+            colors (SimpleNamespace): pygame.Color per configured color name
+        """
+        sprite = pygame.Surface((self.cell_size, self.cell_size), pygame.SRCALPHA)
+        center = (self._half_cell, self._half_cell)
+        pygame.draw.circle(sprite, colors.food, center, self._radius)
+        pygame.draw.circle(sprite, colors.text, center, self._radius, 2)
+        
+        # Match the display format once so every blit is a plain copy
+        if pygame.display.get_surface() is not None:
+            sprite = sprite.convert_alpha()
+        self._sprite = sprite
+    
+    def draw(self, surface: pygame.Surface) -> Tuple[Optional[pygame.Rect], pygame.Rect]:
         """
         Draw food on the game surface.
         
         Args:
             surface (pygame.Surface): Surface to draw on
-            colors (dict): Color configuration
+            
+        Returns:
+            Tuple[Optional[pygame.Rect], pygame.Rect]: Cell the food was last
+                drawn in (None on first draw) and the cell it was drawn in now,
+                for callers that update the display by dirty rectangles
         """
         x, y = self.position
-        rect = pygame.Rect(
-            x * self.cell_size + 2,
-            y * self.cell_size + 2,
-            self.cell_size - 4,
-            self.cell_size - 4
-        )
-        
-        # Draw food as a circle
-        center_x = x * self.cell_size + self.cell_size // 2
-        center_y = y * self.cell_size + self.cell_size // 2
-        radius = self.cell_size // 3
-        
-        pygame.draw.circle(surface, colors['food'], (center_x, center_y), radius)
-        pygame.draw.circle(surface, colors['text'], (center_x, center_y), radius, 2)
+        rect = surface.blit(self._sprite, (x * self.cell_size, y * self.cell_size))
+        old_rect, self._last_rect = self._last_rect, rect
+        return old_rect, rect
     
     def get_stats(self) -> dict:
         """
@@ -1,11 +1,42 @@
 import pygame
+import asyncio
 import json
 import sys
 import os
-from typing import Dict, Any
+import time
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import Dict, Any, Optional
 from src.snake import Snake, Direction
 from src.food import Food
-from src.game_stats import GameStats
+from src.game_stats import GameStats, DEFAULT_MAX_HISTORY_RECORDS
+
+# Movement keys (arrows and WASD) and the direction each one selects
+KEY_DIRECTIONS = {
+    pygame.K_UP: Direction.UP,
+    pygame.K_w: Direction.UP,
+    pygame.K_DOWN: Direction.DOWN,
+    pygame.K_s: Direction.DOWN,
+    pygame.K_LEFT: Direction.LEFT,
+    pygame.K_a: Direction.LEFT,
+    pygame.K_RIGHT: Direction.RIGHT,
+    pygame.K_d: Direction.RIGHT
+}
+
+# Frame time for rendering, and the most logic steps one frame may catch up
+RENDER_INTERVAL = 1 / 60
+MAX_LOGIC_STEPS = 5
+
+# How often input is polled while nothing moves (paused or game over)
+IDLE_INTERVAL = 0.1
+
+# Parsed config files keyed by (path, mtime) so restarts skip re-reading
+_CONFIG_CACHE: Dict[Any, Dict[str, Any]] = {}
+
+@lru_cache(maxsize=64)
+def _render_text(font: pygame.font.Font, text: str, color: str) -> pygame.Surface:
+    """Render antialiased text; memoized so unchanged text is not re-rasterized."""
+    return font.render(text, True, pygame.Color(color))
 
 class SnakeGame:
     """
@@ -29,19 +60,35 @@ class SnakeGame:
         pygame.init()
         pygame.display.set_caption("Snake Game - Portfolio Project")
         
+        # Let SDL drop every event the game ignores before it reaches Python;
+        # exposes still get through so an uncovered window is redrawn
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, pygame.WINDOWEXPOSED])
+        
         # Game settings
         self.width = self.config['game']['width']
         self.height = self.config['game']['height']
         self.cell_size = self.config['game']['cell_size']
         self.colors = self.config['game']['colors']
         
+        # Parse the hex color strings once, as attributes (e.g. self._col.text)
+        self._col = SimpleNamespace(**{name: pygame.Color(value)
+                                       for name, value in self.colors.items()})
+        
         # Calculate grid dimensions
         self.grid_width = self.width // self.cell_size
         self.grid_height = self.height // self.cell_size
         
         # Create game surface
         self.screen = pygame.display.set_mode((self.width, self.height))
-        self.clock = pygame.time.Clock()
+        self._grid_surface = self._build_grid_surface()
+        
+        # Create stats tracker once; it keeps history in memory across restarts
+        stats_file = self.config['data']['stats_file']
+        high_scores_file = self.config['data']['high_scores_file']
+        max_history_records = self.config['data'].get('max_history_records',
+                                                      DEFAULT_MAX_HISTORY_RECORDS)
+        self.stats = GameStats(stats_file, high_scores_file, max_history_records)
         
         # Initialize game objects
         self._init_game_objects()
@@ -52,11 +99,18 @@ class SnakeGame:
         self.paused = False
         self.score = 0
         self.game_speed = self.config['game']['initial_speed']
+        self.pending_direction: Optional[Direction] = None
+        
+        # Set whenever the scene changes, cleared once it has been drawn
+        self._dirty = True
         
         # Font for text rendering
         self.font = pygame.font.Font(None, 36)
         self.small_font = pygame.font.Font(None, 24)
         
+        # Pause and game over screens are static apart from the final score
+        self._build_overlays()
+        
         print("Snake Game initialized successfully!")
         print(f"Grid size: {self.grid_width}x{self.grid_height}")
         print("Controls: Arrow Keys to move, SPACE to pause, ESC to quit")
@@ -72,8 +126,13 @@ class SnakeGame:
             Dict[str, Any]: Configuration dictionary
         """
         try:
-            with open(config_path, 'r') as f:
-                return json.load(f)
+            key = (config_path, os.stat(config_path).st_mtime_ns)
+            config = _CONFIG_CACHE.get(key)
+            if config is None:
+                with open(config_path, 'r') as f:
+                    config = json.load(f)
+                _CONFIG_CACHE[key] = config
+            return config
         except (FileNotFoundError, json.JSONDecodeError) as e:
             print(f"Error loading config: {e}")
             # Return default configuration
@@ -95,7 +154,8 @@ class SnakeGame:
                 },
                 "data": {
                     "save_game_history": True,
-                    "stats_file": "data/game_stats.json",
+                    "max_history_records": 1000,
+                    "stats_file": "data/game_stats.jsonl",
                     "high_scores_file": "data/high_scores.json"
                 },
                 "features": {
@@ -109,20 +169,29 @@ class SnakeGame:
         # Create snake in center of grid
         start_x = self.grid_width // 2
         start_y = self.grid_height // 2
-        self.snake = Snake(start_x, start_y, self.cell_size)
+        self.snake = Snake(start_x, start_y, self.cell_size,
+                           self.grid_width, self.grid_height)
         
         # Create food
-        self.food = Food(self.cell_size, self.grid_width, self.grid_height)
+        self.food = Food(self.cell_size, self.grid_width, self.grid_height,
+                         self._col, self.snake.occupancy)
         
-        # Create stats tracker
-        stats_file = self.config['data']['stats_file']
-        high_scores_file = self.config['data']['high_scores_file']
-        self.stats = GameStats(stats_file, high_scores_file)
+        # Start tracking a new session
         self.stats.start_new_game()
     
     def handle_input(self) -> None:
-        """Handle user input events."""
-        for event in pygame.event.get():
+        """
+        Handle user input events.
+        
+        Movement keys are coalesced: only the last one pressed before the
+        next move is applied (by update_game), since earlier ones would be
+        overridden before the snake moves anyway.
+        """
+        events = pygame.event.get()
+        if events:
+            self._dirty = True
+        
+        for event in events:
             if event.type == pygame.QUIT:
                 self.running = False
             
@@ -139,19 +208,18 @@ class SnakeGame:
                 
                 elif not self.paused and not self.game_over:
                     # Movement controls
-                    if event.key == pygame.K_UP or event.key == pygame.K_w:
-                        self.snake.change_direction(Direction.UP)
-                    elif event.key == pygame.K_DOWN or event.key == pygame.K_s:
-                        self.snake.change_direction(Direction.DOWN)
-                    elif event.key == pygame.K_LEFT or event.key == pygame.K_a:
-                        self.snake.change_direction(Direction.LEFT)
-                    elif event.key == pygame.K_RIGHT or event.key == pygame.K_d:
-                        self.snake.change_direction(Direction.RIGHT)
+                    self.pending_direction = KEY_DIRECTIONS.get(event.key, self.pending_direction)
     
     def update_game(self) -> None:
         """Update game state."""
         if self.paused or self.game_over:
             return
+        self._dirty = True
+        
+        # Apply the latest movement key, once per move
+        if self.pending_direction is not None:
+            self.snake.change_direction(self.pending_direction)
+            self.pending_direction = None
         
         # Move snake
         self.snake.move()
@@ -167,7 +235,7 @@ class SnakeGame:
             return
         
         # Check food collision
-        if self.food.check_collision(self.snake.get_head_position()):
+        if self.food.check_collision(self.snake.head_idx):
             self.snake.grow()
             self.score += 10
             
@@ -175,28 +243,56 @@ class SnakeGame:
             if self.game_speed > 50:
                 self.game_speed -= self.config['game']['speed_increase']
             
-            # Spawn new food
-            self.food.spawn_food(self.snake.body)
-        
-        # Update statistics
-        snake_data = self.snake.get_analytics_data()
-        food_data = self.food.get_stats()
-        self.stats.update_game_stats(snake_data, food_data, self.score)
+            # Spawn new food; once the snake fills the grid the game is won
+            if not self.food.spawn_food(self.snake.get_length()):
+                self.end_game()
+                return
+            
+            # Update statistics (only read at game end, so not every tick)
+            self.stats.update_game_stats(self.snake.get_analytics_data(),
+                                         self.food.get_stats(), self.score)
     
-    def draw_grid(self) -> None:
-        """Draw background grid."""
-        if not self.config['features']['show_grid']:
-            return
+    def _build_grid_surface(self) -> pygame.Surface:
+        """
+        Render the background grid once onto a transparent surface.
         
-        grid_color = pygame.Color(self.colors['grid'])
+        Returns:
+            pygame.Surface: Screen-sized surface holding the grid lines
+        """
+        grid_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        grid_color = self._col.grid
         
         # Draw vertical lines
         for x in range(0, self.width, self.cell_size):
-            pygame.draw.line(self.screen, grid_color, (x, 0), (x, self.height))
+            pygame.draw.line(grid_surface, grid_color, (x, 0), (x, self.height))
         
         # Draw horizontal lines
         for y in range(0, self.height, self.cell_size):
-            pygame.draw.line(self.screen, grid_color, (0, y), (self.width, y))
+            pygame.draw.line(grid_surface, grid_color, (0, y), (self.width, y))
+        
+        return grid_surface.convert_alpha()
+    
+    def draw_grid(self) -> None:
+        """Draw background grid."""
+        if not self.config['features']['show_grid']:
+            return
+        
+        self.screen.blit(self._grid_surface, (0, 0))
+    
+    def _render(self, font: pygame.font.Font, text: str,
+                color_key: str = 'text') -> pygame.Surface:
+        """
+        Render text, reusing the surface while the text is unchanged.
+        
+        Args:
+            font (pygame.font.Font): Font to render with
+            text (str): Text to render
+            color_key (str): Name of the configured color to use
+            
+        Returns:
+            pygame.Surface: Rendered text
+        """
+        return _render_text(font, text, self.colors[color_key])
     
     def draw_ui(self) -> None:
         """Draw user interface elements."""
@@ -204,74 +300,74 @@ class SnakeGame:
             return
         
         # Score
-        score_text = self.font.render(f"Score: {self.score}", True, 
-                                     pygame.Color(self.colors['text']))
+        score_text = self._render(self.font, f"Score: {self.score}")
         self.screen.blit(score_text, (10, 10))
         
         # Length
-        length_text = self.small_font.render(f"Length: {self.snake.get_length()}", True,
-                                           pygame.Color(self.colors['text']))
+        length_text = self._render(self.small_font, f"Length: {self.snake.get_length()}")
         self.screen.blit(length_text, (10, 50))
         
         # High score
         high_scores = self.stats.get_high_scores(1)
         if high_scores:
-            high_score_text = self.small_font.render(f"Best: {high_scores[0]['score']}", True,
-                                                   pygame.Color(self.colors['text']))
+            high_score_text = self._render(self.small_font, f"Best: {high_scores[0]['score']}")
             self.screen.blit(high_score_text, (10, 75))
     
+    def _build_overlays(self) -> None:
+        """Pre-render the translucent overlays and their fixed captions."""
+        center_x, center_y = self.width // 2, self.height // 2
+        
+        self._overlay_gameover = pygame.Surface((self.width, self.height))
+        self._overlay_gameover.set_alpha(128)
+        self._overlay_gameover.fill((0, 0, 0))
+        
+        self._overlay_pause = pygame.Surface((self.width, self.height))
+        self._overlay_pause.set_alpha(100)
+        self._overlay_pause.fill((0, 0, 0))
+        
+        game_over_text = self._render(self.font, "GAME OVER")
+        restart_text = self._render(self.small_font, "Press R to restart or ESC to quit")
+        self._gameover_texts = [
+            (game_over_text, game_over_text.get_rect(center=(center_x, center_y - 50))),
+            (restart_text, restart_text.get_rect(center=(center_x, center_y + 50)))
+        ]
+        
+        pause_text = self._render(self.font, "PAUSED")
+        continue_text = self._render(self.small_font, "Press SPACE to continue")
+        self._pause_texts = [
+            (pause_text, pause_text.get_rect(center=(center_x, center_y))),
+            (continue_text, continue_text.get_rect(center=(center_x, center_y + 30)))
+        ]
+    
     def draw_game_over(self) -> None:
         """Draw game over screen."""
-        overlay = pygame.Surface((self.width, self.height))
-        overlay.set_alpha(128)
-        overlay.fill((0, 0, 0))
-        self.screen.blit(overlay, (0, 0))
-        
-        # Game Over text
-        game_over_text = self.font.render("GAME OVER", True, 
-                                         pygame.Color(self.colors['text']))
-        text_rect = game_over_text.get_rect(center=(self.width//2, self.height//2 - 50))
-        self.screen.blit(game_over_text, text_rect)
+        self.screen.blit(self._overlay_gameover, (0, 0))
+        self.screen.blits(self._gameover_texts, doreturn=False)
         
         # Final score
-        score_text = self.font.render(f"Final Score: {self.score}", True,
-                                     pygame.Color(self.colors['text']))
+        score_text = self._render(self.font, f"Final Score: {self.score}")
         score_rect = score_text.get_rect(center=(self.width//2, self.height//2))
         self.screen.blit(score_text, score_rect)
-        
-        # Instructions
-        restart_text = self.small_font.render("Press R to restart or ESC to quit", True,
-                                            pygame.Color(self.colors['text']))
-        restart_rect = restart_text.get_rect(center=(self.width//2, self.height//2 + 50))
-        self.screen.blit(restart_text, restart_rect)
     
     def draw_pause(self) -> None:
         """Draw pause screen."""
-        overlay = pygame.Surface((self.width, self.height))
-        overlay.set_alpha(100)
-        overlay.fill((0, 0, 0))
-        self.screen.blit(overlay, (0, 0))
-        
-        pause_text = self.font.render("PAUSED", True, pygame.Color(self.colors['text']))
-        text_rect = pause_text.get_rect(center=(self.width//2, self.height//2))
-        self.screen.blit(pause_text, text_rect)
-        
-        continue_text = self.small_font.render("Press SPACE to continue", True,
-                                             pygame.Color(self.colors['text']))
-        continue_rect = continue_text.get_rect(center=(self.width//2, self.height//2 + 30))
-        self.screen.blit(continue_text, continue_rect)
+        self.screen.blit(self._overlay_pause, (0, 0))
+        self.screen.blits(self._pause_texts, doreturn=False)
     
     def render(self) -> None:
-        """Render the game."""
+        """Render the game, unless nothing changed since the last frame."""
+        if not self._dirty:
+            return
+        
         # Clear screen
-        self.screen.fill(pygame.Color(self.colors['background']))
+        self.screen.fill(self._col.background)
         
         # Draw grid
         self.draw_grid()
         
         # Draw game objects
-        self.food.draw(self.screen, self.colors)
-        self.snake.draw(self.screen, self.colors)
+        self.food.draw(self.screen)
+        self.snake.draw(self.screen, self._col)
         
         # Draw UI
         self.draw_ui()
@@ -284,9 +380,12 @@ class SnakeGame:
         
         # Update display
         pygame.display.flip()
+        self._dirty = False
     
     def end_game(self) -> None:
         """End the current game."""
+        self.stats.update_game_stats(self.snake.get_analytics_data(),
+                                     self.food.get_stats(), self.score)
         self.game_over = True
         self.stats.end_game()
         print(f"Game Over! Final Score: {self.score}")
@@ -302,34 +401,61 @@ class SnakeGame:
         self.paused = False
         self.score = 0
         self.game_speed = self.config['game']['initial_speed']
+        self.pending_direction = None
         self._init_game_objects()
         print("Game restarted!")
     
-    def run(self) -> None:
-        """Main game loop."""
+    async def run(self) -> None:
+        """
+        Main game loop.
+        
+        Runs as a coroutine so the time between frames is spent awaiting
+        instead of blocking, letting background tasks such as saving
+        statistics make progress (and letting the game run under asyncio
+        based web runtimes).
+        """
         print("Starting Snake Game...")
         
+        logic_accum = 0.0
+        last_time = time.perf_counter()
+        
         while self.running:
+            frame_start = time.perf_counter()
+            logic_accum += frame_start - last_time
+            last_time = frame_start
+            
             # Handle input
             self.handle_input()
             
-            # Update game
-            self.update_game()
+            # Update game in fixed steps: game_speed is the step time in milliseconds
+            logic_interval = self.game_speed / 1000 if self.game_speed > 0 else RENDER_INTERVAL
+            if self.paused or self.game_over:
+                logic_accum = 0.0
+            else:
+                # After a stall, drop the backlog rather than lurching ahead
+                logic_accum = min(logic_accum, MAX_LOGIC_STEPS * logic_interval)
+            while logic_accum >= logic_interval and not self.game_over:
+                self.update_game()
+                logic_accum -= logic_interval
+                logic_interval = self.game_speed / 1000 if self.game_speed > 0 else RENDER_INTERVAL
             
-            # Render
+            # Render at a steady rate, independent of game speed
             self.render()
             
-            # Control frame rate
-            self.clock.tick(1000 // self.game_speed if self.game_speed > 0 else 60)
+            # Nothing moves while paused or over, so just poll input now and then
+            frame_time = IDLE_INTERVAL if self.paused or self.game_over else RENDER_INTERVAL
+            elapsed = time.perf_counter() - frame_start
+            await asyncio.sleep(max(0, frame_time - elapsed))
         
         # Cleanup
+        await self.stats.flush()
         pygame.quit()
         print("Game ended. Thanks for playing!")
 
 def main():
     """Main function to run the game."""
     game = SnakeGame()
-    game.run()
+    asyncio.run(game.run())
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,7 +1,27 @@
+import asyncio
+import heapq
 import json
 import os
+import time
 from datetime import datetime
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+    
+    def _json_dumps(obj: Any) -> bytes:
+        """Serialize compactly to UTF-8, matching orjson.dumps."""
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+# Game history is appended to a JSON Lines file and only rewritten (trimmed
+# back to max_history_records) once COMPACT_EVERY extra games have piled up;
+# the limit normally comes from data.max_history_records in the settings
+DEFAULT_MAX_HISTORY_RECORDS = 1000
+COMPACT_EVERY = 100
 
 class GameStats:
     """
@@ -11,17 +31,20 @@ class GameStats:
     metrics, maintaining high scores, and saving data to JSON files.
     """
     
-    def __init__(self, stats_file: str = "data/game_stats.json", 
-                 high_scores_file: str = "data/high_scores.json"):
+    def __init__(self, stats_file: str = "data/game_stats.jsonl", 
+                 high_scores_file: str = "data/high_scores.json",
+                 max_history_records: int = DEFAULT_MAX_HISTORY_RECORDS):
         """
         Initialize GameStats object.
         
         Args:
-            stats_file (str): Path to game statistics file
+            stats_file (str): Path to game statistics file (JSON Lines)
             high_scores_file (str): Path to high scores file
+            max_history_records (int): Most recent games kept in the history
         """
         self.stats_file = stats_file
         self.high_scores_file = high_scores_file
+        self.max_history_records = max_history_records
         
         # Current game session data
         self.current_session = {
@@ -39,8 +62,20 @@ class GameStats:
         self._ensure_data_directory()
         
         # Load existing data
+        self._file_records = 0
+        self._needs_rewrite = False
+        self._backup_on_rewrite = False
         self.game_history = self._load_game_history()
         self.high_scores = self._load_high_scores()
+        
+        # Running totals over game_history, so summaries never rescan it
+        self._agg = self._aggregate(self.game_history)
+        
+        # perf_counter() at the start of the current session
+        self._t0 = time.perf_counter()
+        
+        # Background save started by end_game, if any
+        self._pending_save: Optional[asyncio.Task] = None
     
     def _ensure_data_directory(self) -> None:
         """Create data directory if it doesn't exist."""
@@ -49,27 +84,98 @@ class GameStats:
             os.makedirs(data_dir)
     
     def _load_game_history(self) -> List[Dict[str, Any]]:
-        """Load game history from file."""
+        """
+        Load game history from file, one JSON record per line.
+        
+        Unreadable lines (e.g. a write cut short) are skipped. A legacy
+        JSON list, either in the stats file itself or in a game_stats.json
+        next to a missing stats file, is loaded instead and converted on
+        the next save. A non-empty file with no readable record is backed
+        up before it is ever replaced.
+        """
+        history = []
+        path = self.stats_file
+        if not os.path.exists(path):
+            path = os.path.splitext(self.stats_file)[0] + '.json'
+            if path == self.stats_file or not os.path.exists(path):
+                return history
+        
         try:
-            if os.path.exists(self.stats_file):
-                with open(self.stats_file, 'r') as f:
-                    return json.load(f)
-        except (json.JSONDecodeError, IOError):
-            pass
-        return []
+            with open(path, 'rb') as f:
+                data = f.read()
+        except IOError:
+            return history
+        
+        if data.lstrip()[:1] == b'[':
+            try:
+                history = _json_loads(data)
+            except ValueError:
+                pass
+            self._needs_rewrite = True
+        else:
+            # Appending after a last line with no newline would merge two records
+            if data and not data.endswith(b'\n'):
+                self._needs_rewrite = True
+            for line in data.splitlines():
+                if not line.strip():
+                    continue
+                self._file_records += 1
+                try:
+                    history.append(_json_loads(line))
+                except ValueError:
+                    self._needs_rewrite = True
+        
+        # Nothing readable in a stats file that has content: keep a copy
+        if not history and path == self.stats_file and data.strip():
+            self._backup_on_rewrite = True
+        return history
     
     def _load_high_scores(self) -> List[Dict[str, Any]]:
         """Load high scores from file."""
         try:
             if os.path.exists(self.high_scores_file):
-                with open(self.high_scores_file, 'r') as f:
-                    return json.load(f)
-        except (json.JSONDecodeError, IOError):
+                with open(self.high_scores_file, 'rb') as f:
+                    return _json_loads(f.read())
+        except (ValueError, IOError):
             pass
         return []
     
+    @staticmethod
+    def _aggregate(games: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Fold a list of games into the running totals used by summaries.
+        
+        Args:
+            games (List[Dict[str, Any]]): Game records to total up
+            
+        Returns:
+            Dict[str, Any]: Game count, playtime, score and food totals
+        """
+        agg = {
+            'total_games': 0,
+            'total_playtime': 0.0,
+            'total_score': 0,
+            'best_score': 0,
+            'total_foods': 0
+        }
+        for game in games:
+            GameStats._add_to_aggregate(agg, game)
+        return agg
+    
+    @staticmethod
+    def _add_to_aggregate(agg: Dict[str, Any], game: Dict[str, Any]) -> None:
+        """Add one game record to running totals in place."""
+        score = game.get('score', 0)
+        agg['total_games'] += 1
+        agg['total_playtime'] += game.get('duration_seconds', 0)
+        agg['total_score'] += score
+        if score > agg['best_score']:
+            agg['best_score'] = score
+        agg['total_foods'] += game.get('foods_eaten', 0)
+    
     def start_new_game(self) -> None:
         """Start tracking a new game session."""
+        self._t0 = time.perf_counter()
         self.current_session = {
             'start_time': datetime.now().isoformat(),
             'end_time': None,
@@ -90,31 +196,31 @@ class GameStats:
             food_data (dict): Food statistics data  
             score (int): Current game score
         """
-        self.current_session.update({
-            'score': score,
-            'max_length': max(self.current_session['max_length'], snake_data['length']),
-            'total_moves': snake_data['total_moves'],
-            'direction_changes': snake_data['direction_changes'],
-            'foods_eaten': food_data['foods_eaten']
-        })
+        session = self.current_session
+        session['score'] = score
+        length = snake_data['length']
+        if length > session['max_length']:
+            session['max_length'] = length
+        session['total_moves'] = snake_data['total_moves']
+        session['direction_changes'] = snake_data['direction_changes']
+        session['foods_eaten'] = food_data['foods_eaten']
     
     def end_game(self) -> None:
         """End current game session and save statistics."""
         if self.current_session['start_time']:
             # Calculate game duration
-            start_time = datetime.fromisoformat(self.current_session['start_time'])
-            end_time = datetime.now()
-            self.current_session['end_time'] = end_time.isoformat()
-            self.current_session['duration_seconds'] = (end_time - start_time).total_seconds()
+            self.current_session['end_time'] = datetime.now().isoformat()
+            self.current_session['duration_seconds'] = time.perf_counter() - self._t0
             
             # Add to game history
             self.game_history.append(self.current_session.copy())
+            self._add_to_aggregate(self._agg, self.current_session)
             
             # Update high scores
             self._update_high_scores()
             
-            # Save data
-            self._save_data()
+            # Save data without blocking the caller
+            self._schedule_save()
     
     def _update_high_scores(self) -> None:
         """Update high scores list with current game."""
@@ -129,23 +235,91 @@ class GameStats:
         
         self.high_scores.append(high_score_entry)
         
-        # Sort by score (descending) and keep top 10
-        self.high_scores.sort(key=lambda x: x['score'], reverse=True)
-        self.high_scores = self.high_scores[:10]
+        # Keep the top 10 by score (descending)
+        self.high_scores = heapq.nlargest(10, self.high_scores, key=lambda x: x['score'])
+    
+    def _schedule_save(self) -> None:
+        """
+        Save statistics in the background when an event loop is running.
+        
+        Without a running loop (e.g. scripts and the REPL) the files are
+        written synchronously instead.
+        """
+        # Decide what to write now, so the writer thread never sees later games
+        max_records = self.max_history_records
+        if self._needs_rewrite or self._file_records >= max_records + COMPACT_EVERY:
+            if len(self.game_history) > max_records:
+                self.game_history = self.game_history[-max_records:]
+                self._agg = self._aggregate(self.game_history)
+            new_records = list(self.game_history)
+            rewrite = True
+            self._file_records = len(new_records)
+            self._needs_rewrite = False
+        else:
+            new_records = self.game_history[-1:]
+            rewrite = False
+            self._file_records += 1
+        high_scores = list(self.high_scores)
+        backup = rewrite and self._backup_on_rewrite
+        if backup:
+            self._backup_on_rewrite = False
+        
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            self._write_data(new_records, rewrite, high_scores, backup)
+            return
+        
+        self._pending_save = asyncio.ensure_future(
+            self._save_data(new_records, rewrite, high_scores, backup, self._pending_save))
     
-    def _save_data(self) -> None:
+    async def _save_data(self, new_records: List[Dict[str, Any]], rewrite: bool,
+                         high_scores: List[Dict[str, Any]], backup: bool = False,
+                         previous: Optional[asyncio.Task] = None) -> None:
+        """
+        Write statistics on a worker thread.
+        
+        Args:
+            new_records (List[Dict[str, Any]]): Games to write
+            rewrite (bool): Replace the history file instead of appending
+            high_scores (List[Dict[str, Any]]): High scores to save
+            backup (bool): Move the old history file aside to .bak first
+            previous (Optional[asyncio.Task]): Earlier save that must finish
+                first, so two writes never interleave on the same file
+        """
+        if previous is not None:
+            await previous
+        await asyncio.to_thread(self._write_data, new_records, rewrite, high_scores, backup)
+    
+    def _write_data(self, new_records: List[Dict[str, Any]], rewrite: bool,
+                    high_scores: List[Dict[str, Any]], backup: bool = False) -> None:
         """Save game statistics to files."""
         try:
-            # Save game history (keep last 1000 games)
-            with open(self.stats_file, 'w') as f:
-                json.dump(self.game_history[-1000:], f, indent=2)
+            lines = b''.join(_json_dumps(record) + b'\n' for record in new_records)
+            if rewrite:
+                # Replace atomically so a crash never leaves a half-written history
+                tmp_file = self.stats_file + '.tmp'
+                with open(tmp_file, 'wb') as f:
+                    f.write(lines)
+                if backup and os.path.exists(self.stats_file):
+                    os.replace(self.stats_file, self.stats_file + '.bak')
+                os.replace(tmp_file, self.stats_file)
+            else:
+                with open(self.stats_file, 'ab') as f:
+                    f.write(lines)
             
             # Save high scores
-            with open(self.high_scores_file, 'w') as f:
-                json.dump(self.high_scores, f, indent=2)
+            with open(self.high_scores_file, 'wb') as f:
+                f.write(_json_dumps(high_scores))
         except IOError as e:
             print(f"Error saving game data: {e}")
     
+    async def flush(self) -> None:
+        """Wait for any background save to finish."""
+        if self._pending_save is not None:
+            await self._pending_save
+            self._pending_save = None
+    
     def get_current_stats(self) -> dict:
         """Get current game session statistics."""
         return self.current_session.copy()
@@ -169,7 +343,9 @@ class GameStats:
         Returns:
             dict: Summary statistics across all games
         """
-        if not self.game_history:
+        agg = self._agg
+        total_games = agg['total_games']
+        if not total_games:
             return {
                 'total_games': 0,
                 'total_playtime': 0,
@@ -178,11 +354,10 @@ class GameStats:
                 'total_foods_eaten': 0
             }
         
-        total_games = len(self.game_history)
-        total_playtime = sum(game.get('duration_seconds', 0) for game in self.game_history)
-        total_score = sum(game.get('score', 0) for game in self.game_history)
-        best_score = max(game.get('score', 0) for game in self.game_history)
-        total_foods = sum(game.get('foods_eaten', 0) for game in self.game_history)
+        total_playtime = agg['total_playtime']
+        total_score = agg['total_score']
+        best_score = agg['best_score']
+        total_foods = agg['total_foods']
         
         return {
             'total_games': total_games,
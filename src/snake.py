@@ -1,6 +1,9 @@
 import pygame
+from array import array
 from enum import Enum
-from typing import List, Tuple
+from itertools import chain, repeat
+from types import SimpleNamespace
+from typing import Iterator, List, Tuple
 
 class Direction(Enum):
     UP = (0, -1)
@@ -8,15 +11,28 @@ class Direction(Enum):
     LEFT = (-1, 0)
     RIGHT = (1, 0)
 
+# Reversing into these would run the snake into its own neck
+_OPPOSITE = {
+    Direction.UP: Direction.DOWN,
+    Direction.DOWN: Direction.UP,
+    Direction.LEFT: Direction.RIGHT,
+    Direction.RIGHT: Direction.LEFT
+}
+
+# Segments the body storage holds before it first needs to grow
+_INITIAL_CAPACITY = 64
+
 class Snake:
     """
     Snake class representing the player-controlled snake in the game.
     
     This class handles snake movement, growth, collision detection,
-    and rendering. It maintains the snake's body as a list of segments.
+    and rendering. It stores the body as parallel x and y int arrays used
+    as a ring buffer, head first, so moving is O(1) at both ends.
     """
     
-    def __init__(self, start_x: int, start_y: int, cell_size: int):
+    def __init__(self, start_x: int, start_y: int, cell_size: int,
+                 grid_width: int, grid_height: int):
         """
         Initialize the snake at starting position.
         
@@ -24,28 +40,71 @@ class Snake:
             start_x (int): Starting x coordinate (in grid units)
             start_y (int): Starting y coordinate (in grid units)
             cell_size (int): Size of each cell in pixels
+            grid_width (int): Width of game grid in cells
+            grid_height (int): Height of game grid in cells
         """
         self.cell_size = cell_size
-        self.body = [(start_x, start_y)]
+        self.grid_width = grid_width
+        self.grid_height = grid_height
+        
+        # Segment i (0 is the head) lives at index (_head + i) % capacity
+        self._xs = array('i', [start_x]) * _INITIAL_CAPACITY
+        self._ys = array('i', [start_y]) * _INITIAL_CAPACITY
+        self._head = 0
+        self._length = 1
+        
+        # Head as flat index y * grid_width + x, for integer compares
+        self.head_idx = start_y * grid_width + start_x
+        
+        # Flat occupancy grid (same indexing, 1 where the body is) for O(1)
+        # collision tests; cells off the grid are never recorded
+        self._occ = bytearray(grid_width * grid_height)
+        self._occ[self.head_idx] = 1
+        self._self_collision = False
         self.direction = Direction.RIGHT
+        
+        # Step for the current direction, kept in sync by change_direction
+        self._dx, self._dy = 1, 0
         self.grow_flag = False
         
+        # Segment tiles, built on first draw for the given colors
+        self._tile_colors = None
+        
         # Track movement history for analytics
         self.total_moves = 0
         self.direction_changes = 0
         
     def move(self) -> None:
         """Move the snake in its current direction."""
-        head_x, head_y = self.body[0]
-        dir_x, dir_y = self.direction.value
-        
-        new_head = (head_x + dir_x, head_y + dir_y)
-        self.body.insert(0, new_head)
+        dir_x, dir_y = self._dx, self._dy
+        new_x = self._xs[self._head] + dir_x
+        new_y = self._ys[self._head] + dir_y
+        width, height = self.grid_width, self.grid_height
+        occ = self._occ
         
+        # Tail leaves before head enters, so following the tail is safe
         if not self.grow_flag:
-            self.body.pop()
+            tail_x, tail_y = self.get_tail_position()
+            if 0 <= tail_x < width and 0 <= tail_y < height:
+                occ[tail_y * width + tail_x] = 0
         else:
             self.grow_flag = False
+            if self._length == len(self._xs):
+                self._grow_storage()
+            self._length += 1
+        
+        # Without growth the new head overwrites the old tail's slot
+        self._head = (self._head - 1) % len(self._xs)
+        self._xs[self._head] = new_x
+        self._ys[self._head] = new_y
+        self.head_idx += dir_y * width + dir_x
+        
+        # A head off the grid is caught by check_wall_collision instead
+        if 0 <= new_x < width and 0 <= new_y < height:
+            self._self_collision = occ[self.head_idx] == 1
+            occ[self.head_idx] = 1
+        else:
+            self._self_collision = False
             
         self.total_moves += 1
     
@@ -60,17 +119,11 @@ class Snake:
             bool: True if direction was changed, False if invalid
         """
         # Prevent 180-degree turns
-        opposite_directions = {
-            Direction.UP: Direction.DOWN,
-            Direction.DOWN: Direction.UP,
-            Direction.LEFT: Direction.RIGHT,
-            Direction.RIGHT: Direction.LEFT
-        }
-        
-        if new_direction != opposite_directions.get(self.direction):
-            if new_direction != self.direction:
+        if new_direction is not _OPPOSITE[self.direction]:
+            if new_direction is not self.direction:
                 self.direction_changes += 1
             self.direction = new_direction
+            self._dx, self._dy = new_direction.value
             return True
         return False
     
@@ -89,7 +142,7 @@ class Snake:
         Returns:
             bool: True if collision detected
         """
-        head_x, head_y = self.body[0]
+        head_x, head_y = self.get_head_position()
         return (head_x < 0 or head_x >= width or 
                 head_y < 0 or head_y >= height)
     
@@ -97,44 +150,110 @@ class Snake:
         """
         Check if snake collided with itself.
         
+        The test itself happens in move(), against the occupancy grid.
+        
         Returns:
             bool: True if self-collision detected
         """
-        head = self.body[0]
-        return head in self.body[1:]
+        return self._self_collision
+    
+    @property
+    def occupancy(self) -> bytearray:
+        """
+        Flat occupancy grid, index y * grid_width + x, 1 where the snake is.
+        
+        Kept in sync by move and shared with Food (do not modify).
+        """
+        return self._occ
+    
+    @property
+    def body(self) -> List[Tuple[int, int]]:
+        """Body segments head first, as a new list of (x, y) tuples."""
+        return list(self._segments())
+    
+    def _segments(self, start: int = 0) -> Iterator[Tuple[int, int]]:
+        """
+        Iterate over body segments from index start to the tail.
+        
+        Args:
+            start (int): Segment to begin at (0 is the head)
+            
+        Returns:
+            Iterator[Tuple[int, int]]: (x, y) of each segment, head first
+        """
+        xs, ys = self._xs, self._ys
+        capacity = len(xs)
+        first = (self._head + start) % capacity
+        end = first + self._length - start
+        if end <= capacity:
+            return zip(xs[first:end], ys[first:end])
+        end -= capacity
+        return chain(zip(xs[first:], ys[first:]), zip(xs[:end], ys[:end]))
+    
+    def _grow_storage(self) -> None:
+        """Double the body storage, unrolling the full ring head first."""
+        head = self._head
+        self._xs = self._xs[head:] + self._xs[:head]
+        self._ys = self._ys[head:] + self._ys[:head]
+        self._xs.extend(self._xs)
+        self._ys.extend(self._ys)
+        self._head = 0
     
     def get_head_position(self) -> Tuple[int, int]:
         """Get the position of snake's head."""
-        return self.body[0]
+        return (self._xs[self._head], self._ys[self._head])
+    
+    def get_tail_position(self) -> Tuple[int, int]:
+        """Get the position of snake's last segment."""
+        tail = (self._head + self._length - 1) % len(self._xs)
+        return (self._xs[tail], self._ys[tail])
     
     def get_length(self) -> int:
         """Get current length of snake."""
-        return len(self.body)
+        return self._length
     
-    def draw(self, surface: pygame.Surface, colors: dict) -> None:
+    def _build_tiles(self, colors: SimpleNamespace) -> None:
+        """
+        Pre-render head and body tiles with their outlines baked in.
+        
+        Args:
+            colors (SimpleNamespace): pygame.Color per configured color name
+        """
+        size = (self.cell_size, self.cell_size)
+        display_ready = pygame.display.get_surface() is not None
+        
+        self._head_tile = pygame.Surface(size)
+        self._head_tile.fill(colors.snake_head)
+        pygame.draw.rect(self._head_tile, colors.text, self._head_tile.get_rect(), 2)
+        
+        self._body_tile = pygame.Surface(size)
+        self._body_tile.fill(colors.snake)
+        pygame.draw.rect(self._body_tile, colors.background, self._body_tile.get_rect(), 1)
+        
+        if display_ready:
+            self._head_tile = self._head_tile.convert()
+            self._body_tile = self._body_tile.convert()
+        self._tile_colors = colors
+    
+    def draw(self, surface: pygame.Surface, colors: SimpleNamespace) -> None:
         """
         Draw the snake on the game surface.
         
         Args:
             surface (pygame.Surface): Surface to draw on
-            colors (dict): Color configuration
-        """
-        for i, segment in enumerate(self.body):
-            x, y = segment
-            rect = pygame.Rect(
-                x * self.cell_size, 
-                y * self.cell_size, 
-                self.cell_size, 
-                self.cell_size
-            )
-            
-            # Draw head in different color
-            if i == 0:
-                pygame.draw.rect(surface, colors['snake_head'], rect)
-                pygame.draw.rect(surface, colors['text'], rect, 2)
-            else:
-                pygame.draw.rect(surface, colors['snake'], rect)
-                pygame.draw.rect(surface, colors['background'], rect, 1)
+            colors (SimpleNamespace): pygame.Color per configured color name
+        """
+        if self._tile_colors is not colors:
+            self._build_tiles(colors)
+        
+        cs = self.cell_size
+        head_x, head_y = self.get_head_position()
+        
+        # Draw head in different color, then every body segment in one batch,
+        # streamed to blits rather than collected into a list first
+        surface.blit(self._head_tile, (head_x * cs, head_y * cs))
+        positions = ((x * cs, y * cs) for x, y in self._segments(1))
+        surface.blits(zip(repeat(self._body_tile), positions), doreturn=False)
     
     def get_analytics_data(self) -> dict:
         """